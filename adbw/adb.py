@@ -4,12 +4,13 @@ import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import urllib.error
 import urllib.request
 import zipfile
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .config import LOCAL_PLATFORM_TOOLS_DIR, Settings
 from .errors import AdbWizardError
@@ -43,19 +44,24 @@ def set_runtime_options(settings: Settings) -> None:
     RUNTIME_COMMAND_TIMEOUT_SEC = max(5, min(3600, int(settings.command_timeout_sec)))
 
 
-def redact_sensitive_text(text: str) -> str:
-    if not text:
-        return text
-    out = text
-    patterns = [
+REDACTION_PATTERNS = [
+    (re.compile(pat, re.IGNORECASE), repl)
+    for pat, repl in (
         (r"\b(?:\d[ -]*?){13,19}\b", "[REDACTED_CARD]"),
         (r"\b[\w\.-]+@[\w\.-]+\.\w+\b", "[REDACTED_EMAIL]"),
         (r"\b(?:\+?\d{1,3}[-.\s]?)?(?:\(?\d{2,4}\)?[-.\s]?)\d{3,4}[-.\s]?\d{3,4}\b", "[REDACTED_PHONE]"),
         (r"\b(?:token|apikey|api_key|secret|password)\s*[:=]\s*\S+\b", "[REDACTED_SECRET]"),
         (r"\b(?:\d{1,3}\.){3}\d{1,3}\b", "[REDACTED_IP]"),
-    ]
-    for pat, repl in patterns:
-        out = re.sub(pat, repl, out, flags=re.IGNORECASE)
+    )
+]
+
+
+def redact_sensitive_text(text: str) -> str:
+    if not text:
+        return text
+    out = text
+    for pattern, repl in REDACTION_PATTERNS:
+        out = pattern.sub(repl, out)
     return out
 
 
@@ -177,6 +183,47 @@ def run_streaming(cmd: List[str]) -> None:
         append_transcript(f"TIMEOUT streaming command={command_text}")
 
 
+def run_output_chunks(cmd: List[str], chunk_size: int = 65536) -> Iterator[str]:
+    command_text = " ".join(cmd)
+    if RUNTIME_DRY_RUN:
+        print(f"[DRY RUN] {command_text}")
+        log_debug(f"DRY_RUN chunked command={command_text}")
+        append_transcript(f"DRY_RUN chunked command={command_text}")
+        return
+    log_debug(f"RUN chunked command={command_text}")
+    # stderr goes to a temp file so a chatty command cannot block on a full pipe while stdout is read.
+    with tempfile.TemporaryFile() as stderr_file:
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=stderr_file, text=True, encoding="utf-8", errors="replace"
+        )
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(RUNTIME_COMMAND_TIMEOUT_SEC, kill_on_timeout)
+        timer.start()
+        try:
+            for lines in iter(lambda: proc.stdout.readlines(chunk_size), []):
+                yield "".join(lines)
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            returncode = proc.wait()
+        stderr_file.seek(0)
+        stderr = stderr_file.read().decode("utf-8", "replace")
+
+    if timed_out.is_set():
+        returncode = 124
+        stderr = f"Command timed out after {RUNTIME_COMMAND_TIMEOUT_SEC}s"
+        print(f"Chunked command timed out after {RUNTIME_COMMAND_TIMEOUT_SEC}s")
+    log_debug(f"RESULT chunked command={command_text} returncode={returncode} stderr={stderr.strip()}")
+    append_transcript(f"RUN chunked command={command_text} rc={returncode}\nSTDERR:{stderr}")
+
+
 def local_adb_path() -> str:
     local = os.path.join(os.getcwd(), LOCAL_PLATFORM_TOOLS_DIR, "adb")
     if platform.system() == "Windows":
@@ -1,34 +1,86 @@
-import importlib.util
+import functools
 import gzip
+import heapq
+import importlib.util
 import json
 import os
+import re
+import shlex
 import time
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-from .adb import adb_cmd, redact_if_enabled, run, run_streaming
+from .adb import adb_cmd, redact_if_enabled, run, run_output_chunks, run_streaming
 from .devices import Device, list_devices
 
 WORKFLOWS_FILE = ".adb_cli_py_workflows.json"
 PROFILES_FILE = ".adb_cli_py_profiles.json"
 ALIASES_FILE = ".adb_cli_py_aliases.json"
 PLUGINS_DIR = "plugins"
+MAX_PARALLEL_ADB_CALLS = 8
+MAX_PARALLEL_PLUGIN_LOADS = 8
+LOG_CHUNK_COMPRESSLEVEL = 3
+SETTINGS_RESTORE_BATCH_SIZE = 50
+# adb shell service strings are capped near 4 KB on older devices.
+SETTINGS_RESTORE_MAX_SCRIPT_BYTES = 3500
+PROFILE_LIST_LIMIT = 50
+AAPT_BADGING_CACHE_SIZE = 64
+
+_GETPROP_LINE_RE = re.compile(r"^\[([^\]]+)\]:\s*\[([^\]]*)\]")
+_AAPT_PKG_LINE_RE = re.compile(r"^package:(.*)$", re.M)
+_AAPT_NAME_RE = re.compile(r"\bname='([^']+)'")
+_AAPT_VERSION_CODE_RE = re.compile(r"\bversionCode='([^']*)'")
+_AAPT_VERSION_NAME_RE = re.compile(r"\bversionName='([^']*)'")
+_AAPT_MIN_RE = re.compile(r"^sdkVersion:'?([^'\n]+)'?", re.M)
+_AAPT_TGT_RE = re.compile(r"^targetSdkVersion:'?([^'\n]+)'?", re.M)
+_DUMPSYS_VC_RE = re.compile(r"^\s*versionCode=(\d+)", re.M)
+_DUMPSYS_SIGNING_RE = re.compile(r"signatures:|signing", re.I)
+_DUMPSYS_MISMATCH_RE = re.compile(r"signature mismatch|inconsistent certificates|does not match", re.I)
+
+_aapt_badging_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def _read_json(path: str, default: Any) -> Any:
     if not os.path.exists(path):
         return default
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
+        with open(path, "rb") as f:
+            return _loads(f.read())
+    except (OSError, ValueError):
         return default
 
 
 def _write_json(path: str, data: Any) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-        f.write("\n")
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
 
 
 def load_workflows() -> List[Dict[str, Any]]:
@@ -105,9 +157,11 @@ def view_profiles() -> None:
     if not profiles:
         print("No profiles found.")
         return
-    for name in sorted(profiles):
+    for name in heapq.nsmallest(PROFILE_LIST_LIMIT, profiles):
         p = profiles[name]
         print(f"- {name}: package={p.get('package_name','')}, activity={p.get('activity','')}, log_tag={p.get('log_tag','*')}, apk_path={p.get('apk_path','')}")
+    if len(profiles) > PROFILE_LIST_LIMIT:
+        print(f"... {len(profiles) - PROFILE_LIST_LIMIT} more not shown")
 
 
 def build_workflow() -> None:
@@ -139,8 +193,12 @@ def build_workflow() -> None:
     if not steps:
         print("No steps added.")
         return
-    workflows = [w for w in workflows if w.get("name") != name]
-    workflows.append({"name": name, "steps": steps})
+    for i, wf in enumerate(workflows):
+        if wf.get("name") == name:
+            workflows[i] = {"name": name, "steps": steps}
+            break
+    else:
+        workflows.append({"name": name, "steps": steps})
     save_workflows(workflows)
     print(f"Saved workflow: {name}")
 
@@ -242,60 +300,128 @@ def run_dev_loop(adb_path: str, serial: str, active_profile: str = "") -> None:
         print()
 
 
+def _run_shell_parallel(adb_path: str, serial: str, commands: Dict[str, Tuple[str, ...]]) -> Dict[str, str]:
+    # Independent adb shell calls are latency-bound, so fan them out and keep key order.
+    if not commands:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_ADB_CALLS, len(commands))) as pool:
+        futures = {
+            key: pool.submit(run, adb_cmd(adb_path, serial, "shell", *args), check=False)
+            for key, args in commands.items()
+        }
+        return {key: future.result().stdout for key, future in futures.items()}
+
+
+def _redact_values(obj: Any) -> Any:
+    if isinstance(obj, str):
+        return redact_if_enabled(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            obj[key] = _redact_values(value)
+    elif isinstance(obj, list):
+        for i, value in enumerate(obj):
+            obj[i] = _redact_values(value)
+    return obj
+
+
+def _parse_getprop(raw: str) -> Dict[str, str]:
+    props: Dict[str, str] = {}
+    for line in raw.splitlines():
+        m = _GETPROP_LINE_RE.match(line)
+        if m:
+            props[m.group(1)] = m.group(2)
+    return props
+
+
 def export_health_report(adb_path: str, serial: str) -> None:
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     base = f"health_report_{serial}_{timestamp}"
     text_path = f"{base}.txt"
     json_path = f"{base}.json"
+    outputs = _run_shell_parallel(
+        adb_path,
+        serial,
+        {
+            "getprop": ("getprop",),
+            "storage_df": ("df", "-h"),
+            "battery": ("dumpsys", "battery"),
+            "thermal": ("dumpsys", "thermalservice"),
+            "ip_route": ("ip", "route"),
+        },
+    )
+    props = _parse_getprop(outputs.pop("getprop"))
     data: Dict[str, Any] = {
         "serial": serial,
         "timestamp": timestamp,
-        "getprop_model": run(adb_cmd(adb_path, serial, "shell", "getprop", "ro.product.model"), check=False).stdout.strip(),
-        "getprop_brand": run(adb_cmd(adb_path, serial, "shell", "getprop", "ro.product.brand"), check=False).stdout.strip(),
-        "android_version": run(adb_cmd(adb_path, serial, "shell", "getprop", "ro.build.version.release"), check=False).stdout.strip(),
-        "api_level": run(adb_cmd(adb_path, serial, "shell", "getprop", "ro.build.version.sdk"), check=False).stdout.strip(),
-        "storage_df": run(adb_cmd(adb_path, serial, "shell", "df", "-h"), check=False).stdout,
-        "battery": run(adb_cmd(adb_path, serial, "shell", "dumpsys", "battery"), check=False).stdout,
-        "thermal": run(adb_cmd(adb_path, serial, "shell", "dumpsys", "thermalservice"), check=False).stdout,
-        "ip_route": run(adb_cmd(adb_path, serial, "shell", "ip", "route"), check=False).stdout,
+        "getprop_model": props.get("ro.product.model", "").strip(),
+        "getprop_brand": props.get("ro.product.brand", "").strip(),
+        "android_version": props.get("ro.build.version.release", "").strip(),
+        "api_level": props.get("ro.build.version.sdk", "").strip(),
+        **outputs,
     }
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(json.loads(redact_if_enabled(json.dumps(data))), f, indent=2)
-        f.write("\n")
+    _redact_values(data)
+    with open(json_path, "wb") as f:
+        f.write(_dumps(data))
     with open(text_path, "w", encoding="utf-8") as f:
-        for k, v in data.items():
-            f.write(redact_if_enabled(f"## {k}\n{v}\n\n"))
+        f.write("".join(f"## {k}\n{v}\n\n" for k, v in data.items()))
     print(f"Wrote reports: {text_path}, {json_path}")
 
 
 def snapshot_device_state(adb_path: str, serial: str) -> None:
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     path = f"device_snapshot_{serial}_{timestamp}.json"
-    data = {
-        "serial": serial,
-        "timestamp": timestamp,
-        "packages_all": run(adb_cmd(adb_path, serial, "shell", "pm", "list", "packages"), check=False).stdout,
-        "packages_user": run(adb_cmd(adb_path, serial, "shell", "pm", "list", "packages", "-3"), check=False).stdout,
-        "getprop": run(adb_cmd(adb_path, serial, "shell", "getprop"), check=False).stdout,
-        "settings_global": run(adb_cmd(adb_path, serial, "shell", "settings", "list", "global"), check=False).stdout,
-        "settings_system": run(adb_cmd(adb_path, serial, "shell", "settings", "list", "system"), check=False).stdout,
-        "settings_secure": run(adb_cmd(adb_path, serial, "shell", "settings", "list", "secure"), check=False).stdout,
-    }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(json.loads(redact_if_enabled(json.dumps(data))), f, indent=2)
-        f.write("\n")
+    outputs = _run_shell_parallel(
+        adb_path,
+        serial,
+        {
+            "packages_all": ("pm", "list", "packages"),
+            "packages_user": ("pm", "list", "packages", "-3"),
+            "getprop": ("getprop",),
+            "settings_global": ("settings", "list", "global"),
+            "settings_system": ("settings", "list", "system"),
+            "settings_secure": ("settings", "list", "secure"),
+        },
+    )
+    data = {"serial": serial, "timestamp": timestamp, **outputs}
+    with open(path, "wb") as f:
+        f.write(_dumps(_redact_values(data)))
     print(f"Snapshot saved: {path}")
 
 
 def _parse_settings_map(raw: str) -> Dict[str, str]:
     out: Dict[str, str] = {}
     for line in raw.splitlines():
-        if "=" in line:
-            k, v = line.split("=", 1)
+        k, sep, v = line.partition("=")
+        if sep:
             out[k.strip()] = v.strip()
     return out
 
 
+def _settings_put_scripts(
+    namespace: str,
+    settings_map: Dict[str, str],
+    batch_size: int = SETTINGS_RESTORE_BATCH_SIZE,
+    max_bytes: int = SETTINGS_RESTORE_MAX_SCRIPT_BYTES,
+) -> List[str]:
+    prefix, sep, suffix = "rc=0; ", "; ", "; exit $rc"
+    overhead = len((prefix + suffix).encode("utf-8"))
+    scripts: List[str] = []
+    batch: List[str] = []
+    batch_bytes = overhead
+    for key, value in settings_map.items():
+        put = f"settings put {namespace} {shlex.quote(key)} {shlex.quote(value)} || rc=1"
+        put_bytes = len(put.encode("utf-8")) + (len(sep) if batch else 0)
+        if batch and (len(batch) >= batch_size or batch_bytes + put_bytes > max_bytes):
+            scripts.append(prefix + sep.join(batch) + suffix)
+            batch, batch_bytes = [], overhead
+            put_bytes -= len(sep)
+        batch.append(put)
+        batch_bytes += put_bytes
+    if batch:
+        scripts.append(prefix + sep.join(batch) + suffix)
+    return scripts
+
+
 def restore_device_state(adb_path: str, serial: str) -> None:
     path = input("Snapshot JSON path: ").strip().strip('"')
     if not path:
@@ -305,9 +431,9 @@ def restore_device_state(adb_path: str, serial: str) -> None:
         print(f"Snapshot path does not exist: {path}")
         return
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+    except (OSError, ValueError):
         print("Failed to read snapshot file.")
         return
     for namespace in ("global", "system", "secure"):
@@ -318,12 +444,16 @@ def restore_device_state(adb_path: str, serial: str) -> None:
         print(f"Restore {namespace} settings from snapshot? ({len(settings_map)} entries)")
         if input("[y/N]: ").strip().lower() not in ("y", "yes"):
             continue
-        for key, value in settings_map.items():
-            run(adb_cmd(adb_path, serial, "shell", "settings", "put", namespace, key, value), check=False)
+        scripts = _settings_put_scripts(namespace, settings_map)
+        for index, script in enumerate(scripts, start=1):
+            proc = run(adb_cmd(adb_path, serial, "shell", script), check=False)
+            if proc.returncode != 0:
+                print(f"Some {namespace} settings failed to restore (batch {index}/{len(scripts)}, rc={proc.returncode}).")
     print("Restore attempt complete.")
 
 
 def app_permission_manager(adb_path: str, serial: str) -> None:
+    device_cmd = functools.partial(adb_cmd, adb_path, serial)
     package = input("Package name: ").strip()
     if not package:
         print("Package name is required.")
@@ -338,7 +468,7 @@ def app_permission_manager(adb_path: str, serial: str) -> None:
         if choice == "0":
             return
         if choice == "1":
-            out = run(adb_cmd(adb_path, serial, "shell", "dumpsys", "package", package), check=False).stdout
+            out = run(device_cmd("shell", "dumpsys", "package", package), check=False).stdout
             lines = [ln.strip() for ln in out.splitlines() if "android.permission." in ln and ("granted=true" in ln or "granted:" in ln)]
             if not lines:
                 print("(no granted permission lines found)")
@@ -348,17 +478,18 @@ def app_permission_manager(adb_path: str, serial: str) -> None:
         if choice == "2":
             perm = input("Permission (e.g. android.permission.CAMERA): ").strip()
             if perm:
-                run(adb_cmd(adb_path, serial, "shell", "pm", "grant", package, perm), check=False)
+                run(device_cmd("shell", "pm", "grant", package, perm), check=False)
             continue
         if choice == "3":
             perm = input("Permission (e.g. android.permission.CAMERA): ").strip()
             if perm:
-                run(adb_cmd(adb_path, serial, "shell", "pm", "revoke", package, perm), check=False)
+                run(device_cmd("shell", "pm", "revoke", package, perm), check=False)
             continue
         print("Unknown option.")
 
 
 def intent_deeplink_runner(adb_path: str, serial: str) -> None:
+    device_cmd = functools.partial(adb_cmd, adb_path, serial)
     while True:
         print("\nIntent and deep-link runner")
         print("1) Open URL deep link")
@@ -372,22 +503,22 @@ def intent_deeplink_runner(adb_path: str, serial: str) -> None:
         if choice == "1":
             url = input("URL: ").strip()
             if url:
-                run(adb_cmd(adb_path, serial, "shell", "am", "start", "-a", "android.intent.action.VIEW", "-d", url), check=False)
+                run(device_cmd("shell", "am", "start", "-a", "android.intent.action.VIEW", "-d", url), check=False)
             continue
         if choice == "2":
             component = input("Component (package/.Activity): ").strip()
             if component:
-                run(adb_cmd(adb_path, serial, "shell", "am", "start", "-n", component), check=False)
+                run(device_cmd("shell", "am", "start", "-n", component), check=False)
             continue
         if choice == "3":
             action = input("Broadcast action: ").strip()
             if action:
-                run(adb_cmd(adb_path, serial, "shell", "am", "broadcast", "-a", action), check=False)
+                run(device_cmd("shell", "am", "broadcast", "-a", action), check=False)
             continue
         if choice == "4":
             raw = input("am args (without 'am'): ").strip()
             if raw:
-                run(adb_cmd(adb_path, serial, "shell", "am", *raw.split()), check=False)
+                run(device_cmd("shell", "am", *raw.split()), check=False)
             continue
         print("Unknown option.")
 
@@ -409,31 +540,43 @@ def process_service_inspector(adb_path: str, serial: str) -> None:
 
 
 def network_diagnostics_pack(adb_path: str, serial: str) -> None:
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     path = f"network_diag_{serial}_{timestamp}.txt"
-    props = run(adb_cmd(adb_path, serial, "shell", "getprop"), check=False).stdout
-    dns_lines = "\n".join(ln for ln in props.splitlines() if "dns" in ln.lower())
+    outputs = _run_shell_parallel(
+        adb_path,
+        serial,
+        {
+            "getprop": ("getprop",),
+            "ip_addr": ("ip", "addr"),
+            "ip_route": ("ip", "route"),
+            "ping_google": ("ping", "-c", "2", "8.8.8.8"),
+            "connectivity": ("dumpsys", "connectivity"),
+        },
+    )
+    props = _parse_getprop(outputs["getprop"])
+    dns_lines = "\n".join(f"[{k}]: [{v}]" for k, v in props.items() if "dns" in k.lower() or "dns" in v.lower())
     sections = {
-        "ip_addr": run(adb_cmd(adb_path, serial, "shell", "ip", "addr"), check=False).stdout,
-        "ip_route": run(adb_cmd(adb_path, serial, "shell", "ip", "route"), check=False).stdout,
+        "ip_addr": outputs["ip_addr"],
+        "ip_route": outputs["ip_route"],
         "dns_props": dns_lines,
-        "ping_google": run(adb_cmd(adb_path, serial, "shell", "ping", "-c", "2", "8.8.8.8"), check=False).stdout,
-        "connectivity": run(adb_cmd(adb_path, serial, "shell", "dumpsys", "connectivity"), check=False).stdout,
+        "ping_google": outputs["ping_google"],
+        "connectivity": outputs["connectivity"],
     }
+    body = "".join(f"## {key}\n{value}\n\n" for key, value in sections.items())
     with open(path, "w", encoding="utf-8") as f:
-        for key, value in sections.items():
-            f.write(redact_if_enabled(f"## {key}\n{value}\n\n"))
+        f.write(redact_if_enabled(body))
     print(f"Saved network diagnostics: {path}")
 
 
 def interactive_package_search(adb_path: str, serial: str) -> None:
     raw = run(adb_cmd(adb_path, serial, "shell", "pm", "list", "packages"), check=False).stdout
-    packages = [ln.replace("package:", "").strip() for ln in raw.splitlines() if ln.strip()]
+    prefix_len = len("package:")
+    packages = [ln[prefix_len:].strip() for ln in raw.splitlines() if ln.startswith("package:")]
     if not packages:
         print("No packages found.")
         return
     query = input("Search substring: ").strip().lower()
-    matched = [p for p in packages if query in p.lower()] if query else packages[:]
+    matched = [p for p in packages if query in p.lower()] if query else packages
     if not matched:
         print("No matches.")
         return
@@ -518,22 +661,19 @@ def scheduled_log_capture(adb_path: str, serial: str) -> None:
         interval = max(5, int(interval_raw))
     except ValueError:
         interval = 30
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     out_dir = f"scheduled_logs_{serial}_{timestamp}"
     os.makedirs(out_dir, exist_ok=True)
-    end_at = datetime.now().timestamp() + total_seconds
+    end_at = time.monotonic() + total_seconds
     chunk = 1
-    while datetime.now().timestamp() < end_at:
-        chunk_path = os.path.join(out_dir, f"logcat_chunk_{chunk:03d}.txt")
-        raw = run(adb_cmd(adb_path, serial, "logcat", "-d"), check=False).stdout
-        with open(chunk_path, "w", encoding="utf-8") as f:
-            f.write(redact_if_enabled(raw))
-        with open(chunk_path, "rb") as src, gzip.open(f"{chunk_path}.gz", "wb") as dst:
-            dst.write(src.read())
-        os.remove(chunk_path)
+    while time.monotonic() < end_at:
+        chunk_path = os.path.join(out_dir, f"logcat_chunk_{chunk:03d}.txt.gz")
+        with gzip.open(chunk_path, "wt", encoding="utf-8", compresslevel=LOG_CHUNK_COMPRESSLEVEL) as dst:
+            for block in run_output_chunks(adb_cmd(adb_path, serial, "logcat", "-d")):
+                dst.write(redact_if_enabled(block))
         run(adb_cmd(adb_path, serial, "logcat", "-c"), check=False)
         chunk += 1
-        if datetime.now().timestamp() < end_at:
+        if time.monotonic() < end_at:
             time.sleep(interval)
     print(f"Scheduled logs saved in: {out_dir}")
 
@@ -551,6 +691,7 @@ def prerequisite_health_check(adb_path: str) -> None:
 
 
 def manage_port_forwarding(adb_path: str, serial: str) -> None:
+    device_cmd = functools.partial(adb_cmd, adb_path, serial)
     while True:
         print("\nPort forwarding")
         print("1) List forwards")
@@ -563,35 +704,36 @@ def manage_port_forwarding(adb_path: str, serial: str) -> None:
         if choice == "0":
             return
         if choice == "1":
-            out = run([adb_path, "-s", serial, "forward", "--list"], check=False).stdout
+            out = run(device_cmd("forward", "--list"), check=False).stdout
             print(out or "(none)")
             continue
         if choice == "2":
             local = input("Local (e.g. tcp:8081): ").strip()
             remote = input("Remote (e.g. tcp:8081): ").strip()
             if local and remote:
-                run([adb_path, "-s", serial, "forward", local, remote], check=False)
+                run(device_cmd("forward", local, remote), check=False)
             continue
         if choice == "3":
             local = input("Local to remove (e.g. tcp:8081): ").strip()
             if local:
-                run([adb_path, "-s", serial, "forward", "--remove", local], check=False)
+                run(device_cmd("forward", "--remove", local), check=False)
             continue
         if choice == "4":
             remote = input("Remote (e.g. tcp:8081): ").strip()
             local = input("Local (e.g. tcp:8081): ").strip()
             if remote and local:
-                run([adb_path, "-s", serial, "reverse", remote, local], check=False)
+                run(device_cmd("reverse", remote, local), check=False)
             continue
         if choice == "5":
             remote = input("Remote to remove (e.g. tcp:8081): ").strip()
             if remote:
-                run([adb_path, "-s", serial, "reverse", "--remove", remote], check=False)
+                run(device_cmd("reverse", "--remove", remote), check=False)
             continue
         print("Unknown option.")
 
 
 def screen_capture_tools(adb_path: str, serial: str) -> None:
+    device_cmd = functools.partial(adb_cmd, adb_path, serial)
     while True:
         print("\nScreen capture tools")
         print("1) Screenshot (PNG)")
@@ -601,12 +743,12 @@ def screen_capture_tools(adb_path: str, serial: str) -> None:
         if choice == "0":
             return
         if choice == "1":
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             local = f"screenshot_{serial}_{timestamp}.png"
             remote = f"/sdcard/{local}"
-            run(adb_cmd(adb_path, serial, "shell", "screencap", "-p", remote), check=False)
-            run(adb_cmd(adb_path, serial, "pull", remote, local), check=False)
-            run(adb_cmd(adb_path, serial, "shell", "rm", remote), check=False)
+            run(device_cmd("shell", "screencap", "-p", remote), check=False)
+            run(device_cmd("pull", remote, local), check=False)
+            run(device_cmd("shell", "rm", remote), check=False)
             print(f"Saved screenshot: {local}")
             continue
         if choice == "2":
@@ -615,12 +757,12 @@ def screen_capture_tools(adb_path: str, serial: str) -> None:
                 duration = max(1, min(180, int(seconds)))
             except ValueError:
                 duration = 15
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             local = f"screenrecord_{serial}_{timestamp}.mp4"
             remote = f"/sdcard/{local}"
-            run(adb_cmd(adb_path, serial, "shell", "screenrecord", "--time-limit", str(duration), remote), check=False)
-            run(adb_cmd(adb_path, serial, "pull", remote, local), check=False)
-            run(adb_cmd(adb_path, serial, "shell", "rm", remote), check=False)
+            run(device_cmd("shell", "screenrecord", "--time-limit", str(duration), remote), check=False)
+            run(device_cmd("pull", remote, local), check=False)
+            run(device_cmd("shell", "rm", remote), check=False)
             print(f"Saved screenrecord: {local}")
             continue
         print("Unknown option.")
@@ -691,18 +833,27 @@ def run_plugins(adb_path: str, serial: str) -> None:
     if not os.path.isdir(PLUGINS_DIR):
         print(f"No plugins directory found: {PLUGINS_DIR}")
         return
-    plugin_files = sorted(
-        p for p in os.listdir(PLUGINS_DIR) if p.endswith(".py") and not p.startswith("_")
-    )
+    with os.scandir(PLUGINS_DIR) as entries:
+        plugin_files = sorted(
+            (e.name, e.path)
+            for e in entries
+            if e.name.endswith(".py") and not e.name.startswith("_") and e.is_file()
+        )
     if not plugin_files:
         print("No plugins found.")
         return
 
+    # Module top-level code runs concurrently; register() stays serial below.
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PLUGIN_LOADS, len(plugin_files))) as pool:
+        loads = [
+            (filename, pool.submit(_load_plugin, path))
+            for filename, path in plugin_files
+        ]
+
     actions: List[Dict[str, Any]] = []
-    for filename in plugin_files:
-        path = os.path.join(PLUGINS_DIR, filename)
+    for filename, load in loads:
         try:
-            module = _load_plugin(path)
+            module = load.result()
         except Exception as e:
             print(f"Failed loading plugin {filename}: {e}")
             continue
@@ -736,7 +887,41 @@ def run_plugins(adb_path: str, serial: str) -> None:
         print(f"Plugin action failed: {e}")
 
 
-def apk_insight(adb_path: str, serial: str, signature_check_mode: str = "conservative") -> None:
+def _search_group(pattern: re.Pattern, text: str) -> str:
+    m = pattern.search(text)
+    return m.group(1).strip() if m else ""
+
+
+def _parse_aapt_badging(out: str) -> Tuple[str, str, str, str, str]:
+    # package: name='com.example' versionCode='1' versionName='1.0'
+    package_line = _search_group(_AAPT_PKG_LINE_RE, out)
+    return (
+        _search_group(_AAPT_NAME_RE, package_line),
+        _search_group(_AAPT_VERSION_CODE_RE, package_line),
+        _search_group(_AAPT_VERSION_NAME_RE, package_line),
+        _search_group(_AAPT_MIN_RE, out),
+        _search_group(_AAPT_TGT_RE, out),
+    )
+
+
+def _aapt_badging(apk: str) -> str:
+    st = os.stat(apk)
+    key = (apk, st.st_mtime_ns, st.st_size)
+    cached = _aapt_badging_cache.get(key)
+    if cached is not None:
+        return cached
+    proc = run(["aapt", "dump", "badging", apk], check=False)
+    # Dry-run and failed runs return empty or partial output; only keep real results.
+    if proc.returncode == 0 and proc.stdout:
+        if len(_aapt_badging_cache) >= AAPT_BADGING_CACHE_SIZE:
+            _aapt_badging_cache.pop(next(iter(_aapt_badging_cache)))
+        _aapt_badging_cache[key] = proc.stdout
+    return proc.stdout
+
+
+def apk_insight(
+    adb_path: str, serial: str, signature_check_mode: str = "conservative", check_installed: bool = True
+) -> None:
     apk = input("APK path: ").strip().strip('"')
     if not apk:
         print("APK path is required.")
@@ -746,7 +931,7 @@ def apk_insight(adb_path: str, serial: str, signature_check_mode: str = "conserv
         return
     # Prefer aapt if available for metadata extraction.
     try:
-        out = run(["aapt", "dump", "badging", apk], check=False).stdout
+        out = _aapt_badging(apk)
     except Exception:
         out = ""
     package_name = ""
@@ -755,50 +940,32 @@ def apk_insight(adb_path: str, serial: str, signature_check_mode: str = "conserv
     min_sdk = ""
     target_sdk = ""
     if out:
-        for line in out.splitlines():
-            line = line.strip()
-            if line.startswith("package:"):
-                # package: name='com.example' versionCode='1' versionName='1.0'
-                parts = line.replace("'", "").split()
-                for p in parts:
-                    if p.startswith("name="):
-                        package_name = p.split("=", 1)[1]
-                    if p.startswith("versionCode="):
-                        version_code = p.split("=", 1)[1]
-                    if p.startswith("versionName="):
-                        version_name = p.split("=", 1)[1]
-            if line.startswith("sdkVersion:"):
-                min_sdk = line.split(":", 1)[1].replace("'", "").strip()
-            if line.startswith("targetSdkVersion:"):
-                target_sdk = line.split(":", 1)[1].replace("'", "").strip()
+        package_name, version_code, version_name, min_sdk, target_sdk = _parse_aapt_badging(out)
     else:
         print("aapt not found or metadata unavailable. Install Android build-tools for richer APK insight.")
-    print(f"APK: {apk}")
-    print(f"Package: {package_name or 'unknown'}")
-    print(f"Version code: {version_code or 'unknown'}")
-    print(f"Version name: {version_name or 'unknown'}")
-    print(f"minSdk: {min_sdk or 'unknown'}")
-    print(f"targetSdk: {target_sdk or 'unknown'}")
-
-    if package_name and version_code.isdigit():
-        details = run(adb_cmd(adb_path, serial, "shell", "dumpsys", "package", package_name), check=False).stdout
-        installed_code = ""
-        has_signing_details = False
-        for line in details.splitlines():
-            line = line.strip()
-            if line.startswith("versionCode="):
-                installed_code = line.split("=", 1)[1].split()[0].strip()
-            if "signatures:" in line.lower() or "signing" in line.lower():
-                has_signing_details = True
+    print(
+        f"APK: {apk}\nPackage: {package_name or 'unknown'}\n"
+        f"Version code: {version_code or 'unknown'}\nVersion name: {version_name or 'unknown'}\n"
+        f"minSdk: {min_sdk or 'unknown'}\ntargetSdk: {target_sdk or 'unknown'}"
+    )
+
+    if not package_name or not version_code.isdigit():
+        return
+    mode = (signature_check_mode or "conservative").lower()
+    # Downgrade and signature warnings both need the installed package details.
+    if not check_installed and mode == "off":
+        return
+    details = run(adb_cmd(adb_path, serial, "shell", "dumpsys", "package", package_name), check=False).stdout
+    has_signing_details = _DUMPSYS_SIGNING_RE.search(details) is not None
+    if check_installed:
+        m = _DUMPSYS_VC_RE.search(details)
+        installed_code = m.group(1) if m else ""
         if installed_code.isdigit():
             if int(version_code) < int(installed_code):
                 print("Warning: APK versionCode is lower than installed version (potential downgrade).")
-        mode = (signature_check_mode or "conservative").lower()
-        if mode == "strict" and has_signing_details:
-            print("Warning: Strict mode enabled; signature mismatch cannot be verified reliably from dumpsys output.")
-        elif mode == "conservative" and has_signing_details:
-            # Conservative mode only warns when explicit mismatch wording appears.
-            text = details.lower()
-            mismatch_signals = ("signature mismatch", "inconsistent certificates", "does not match")
-            if any(s in text for s in mismatch_signals):
-                print("Warning: Installed package signature may differ; install may fail.")
+    if mode == "strict" and has_signing_details:
+        print("Warning: Strict mode enabled; signature mismatch cannot be verified reliably from dumpsys output.")
+    elif mode == "conservative" and has_signing_details:
+        # Conservative mode only warns when explicit mismatch wording appears.
+        if _DUMPSYS_MISMATCH_RE.search(details):
+            print("Warning: Installed package signature may differ; install may fail.")
@@ -1,5 +1,5 @@
 import os
-from typing import List
+from typing import Callable, Dict, List, Optional
 
 from .actions import (
     collect_bugreport_bundle,
@@ -44,14 +44,22 @@ from .adb import adb_cmd, ensure_adb, run, run_streaming
 from .config import SETTINGS_FILE, Settings, save_settings
 from .devices import Device, list_devices, pick_device, show_device_summary
 from .ui_strings import (
-    ADB_MENU_LINES,
-    ADVANCED_MENU_LINES,
-    APP_PACKAGE_MENU_LINES,
-    DEVICE_SESSION_MENU_LINES,
-    FILE_TRANSFER_MENU_LINES,
-    LOGGING_MENU_LINES,
-    PLATFORM_TOOLS_MENU_LINES,
-    UTILITIES_MENU_LINES,
+    ADB_MENU_ACTIONS,
+    ADB_MENU_TEXT,
+    ADVANCED_MENU_ACTIONS,
+    ADVANCED_MENU_TEXT,
+    APP_PACKAGE_MENU_ACTIONS,
+    APP_PACKAGE_MENU_TEXT,
+    DEVICE_SESSION_MENU_ACTIONS,
+    DEVICE_SESSION_MENU_TEXT,
+    FILE_TRANSFER_MENU_ACTIONS,
+    FILE_TRANSFER_MENU_TEXT,
+    LOGGING_MENU_ACTIONS,
+    LOGGING_MENU_TEXT,
+    PLATFORM_TOOLS_MENU_ACTIONS,
+    PLATFORM_TOOLS_MENU_TEXT,
+    UTILITIES_MENU_ACTIONS,
+    UTILITIES_MENU_TEXT,
 )
 
 
@@ -60,11 +68,6 @@ def confirm(prompt: str) -> bool:
     return answer in ("y", "yes")
 
 
-def _print_menu(lines: List[str]) -> None:
-    for line in lines:
-        print(line)
-
-
 def _non_empty_input(prompt: str) -> str:
     return input(prompt).strip().strip('"')
 
@@ -163,151 +166,160 @@ def _handle_reboot_menu(adb_path: str, serial: str) -> None:
         print("Unknown option.")
 
 
+def _dispatch(handlers: Dict[str, Callable[[], None]], action: Optional[str]) -> None:
+    handler = handlers.get(action or "")
+    if handler is None:
+        print("Unknown option.")
+        return
+    handler()
+
+
+def _handle_switch_device(adb_path: str, device: Device, settings: Settings) -> Device:
+    devices = list_devices(adb_path)
+    new_device = pick_device(devices)
+    if new_device.state == "unauthorized":
+        print("Selected device is unauthorized. Unlock and accept USB debugging, then retry.")
+        return device
+    if settings.remember_last_device:
+        settings.last_device_serial = new_device.serial
+        save_settings(settings)
+    print(f"Switched to {new_device.serial}.")
+    return new_device
+
+
+def _handle_wifi_connect(adb_path: str, serial: str) -> None:
+    if confirm("Connect this device over Wi-Fi now?"):
+        connect_over_wifi(adb_path, serial)
+
+
+def _handle_wifi_disconnect(adb_path: str) -> None:
+    if confirm("Disconnect Wi-Fi adb endpoint(s) now?"):
+        disconnect_wifi(adb_path)
+
+
+def _handle_tail_logcat(adb_path: str, serial: str) -> None:
+    try:
+        run_streaming(adb_cmd(adb_path, serial, "logcat"))
+    except KeyboardInterrupt:
+        print()
+
+
+def _handle_bugreport_bundle(adb_path: str, serial: str) -> None:
+    if confirm("Collect diagnostics bundle now? This may take a while."):
+        collect_bugreport_bundle(adb_path, serial)
+
+
+def _handle_snapshot_restore(adb_path: str, serial: str) -> None:
+    print("1) Create snapshot")
+    print("2) Restore snapshot")
+    action = input("> ").strip()
+    if action == "1":
+        snapshot_device_state(adb_path, serial)
+    elif action == "2":
+        restore_device_state(adb_path, serial)
+    else:
+        print("Unknown option.")
+
+
 def _show_device_session_menu(adb_path: str, device: Device, settings: Settings) -> Device:
+    handlers: Dict[str, Callable[[], None]] = {
+        "summary": lambda: show_device_summary(adb_path, device.serial),
+        "reboot": lambda: _handle_reboot_menu(adb_path, device.serial),
+        "wifi_connect": lambda: _handle_wifi_connect(adb_path, device.serial),
+        "wifi_disconnect": lambda: _handle_wifi_disconnect(adb_path),
+    }
     while True:
         print("\nDevice and session")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(DEVICE_SESSION_MENU_LINES)
-        choice = input("> ").strip()
+        print(DEVICE_SESSION_MENU_TEXT)
+        action = DEVICE_SESSION_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return device
-        if choice == "1":
-            show_device_summary(adb_path, device.serial)
-            continue
-        if choice == "2":
-            devices = list_devices(adb_path)
-            new_device = pick_device(devices)
-            if new_device.state == "unauthorized":
-                print("Selected device is unauthorized. Unlock and accept USB debugging, then retry.")
-                continue
-            device = new_device
-            if settings.remember_last_device:
-                settings.last_device_serial = device.serial
-                save_settings(settings)
-            print(f"Switched to {device.serial}.")
+        if action == "switch_device":
+            device = _handle_switch_device(adb_path, device, settings)
             continue
-        if choice == "3":
-            _handle_reboot_menu(adb_path, device.serial)
-            continue
-        if choice == "4":
-            if not confirm("Connect this device over Wi-Fi now?"):
-                continue
-            connect_over_wifi(adb_path, device.serial)
-            continue
-        if choice == "5":
-            if not confirm("Disconnect Wi-Fi adb endpoint(s) now?"):
-                continue
-            disconnect_wifi(adb_path)
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def _show_app_package_menu(adb_path: str, device: Device, settings: Settings) -> None:
+    serial = device.serial
+    handlers: Dict[str, Callable[[], None]] = {
+        "install_apk": lambda: _handle_install_apk(adb_path, serial),
+        "install_split_apks": lambda: install_split_apks(adb_path, serial),
+        "apk_insight": lambda: apk_insight(adb_path, serial, signature_check_mode=settings.apk_signature_check_mode),
+        "apk_metadata": lambda: apk_insight(adb_path, serial, signature_check_mode="off", check_installed=False),
+        "list_packages": lambda: list_packages(adb_path, serial),
+        "package_info": lambda: show_package_info(adb_path, serial),
+        "launch_app": lambda: launch_app(adb_path, serial),
+        "uninstall": lambda: _handle_package_action(
+            adb_path,
+            serial,
+            "Package name to uninstall: ",
+            ["Uninstall {package}?", "uninstall"],
+            "Uninstall command sent.",
+        ),
+        "force_stop": lambda: _handle_package_action(
+            adb_path,
+            serial,
+            "Package name to force-stop: ",
+            ["Force-stop {package}?", "shell", "am", "force-stop"],
+            "Force-stop command sent.",
+        ),
+        "clear_data": lambda: _handle_package_action(
+            adb_path,
+            serial,
+            "Package name to clear app data: ",
+            ["Clear app data for {package}?", "shell", "pm", "clear"],
+            "Clear data command sent.",
+        ),
+    }
     while True:
         print("\nApp and package")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(APP_PACKAGE_MENU_LINES)
-        choice = input("> ").strip()
+        print(APP_PACKAGE_MENU_TEXT)
+        action = APP_PACKAGE_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return
-        if choice == "1":
-            _handle_install_apk(adb_path, device.serial)
-            continue
-        if choice == "2":
-            install_split_apks(adb_path, device.serial)
-            continue
-        if choice == "3":
-            apk_insight(adb_path, device.serial, signature_check_mode=settings.apk_signature_check_mode)
-            continue
-        if choice == "4":
-            list_packages(adb_path, device.serial)
-            continue
-        if choice == "5":
-            show_package_info(adb_path, device.serial)
-            continue
-        if choice == "6":
-            launch_app(adb_path, device.serial)
-            continue
-        if choice == "7":
-            _handle_package_action(
-                adb_path,
-                device.serial,
-                "Package name to uninstall: ",
-                ["Uninstall {package}?", "uninstall"],
-                "Uninstall command sent.",
-            )
-            continue
-        if choice == "8":
-            _handle_package_action(
-                adb_path,
-                device.serial,
-                "Package name to force-stop: ",
-                ["Force-stop {package}?", "shell", "am", "force-stop"],
-                "Force-stop command sent.",
-            )
-            continue
-        if choice == "9":
-            _handle_package_action(
-                adb_path,
-                device.serial,
-                "Package name to clear app data: ",
-                ["Clear app data for {package}?", "shell", "pm", "clear"],
-                "Clear data command sent.",
-            )
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def _show_file_transfer_menu(adb_path: str, device: Device) -> None:
+    serial = device.serial
+    handlers: Dict[str, Callable[[], None]] = {
+        "push": lambda: _handle_push(adb_path, serial),
+        "pull": lambda: _handle_pull(adb_path, serial),
+    }
     while True:
         print("\nFile transfer")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(FILE_TRANSFER_MENU_LINES)
-        choice = input("> ").strip()
+        print(FILE_TRANSFER_MENU_TEXT)
+        action = FILE_TRANSFER_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return
-        if choice == "1":
-            _handle_push(adb_path, device.serial)
-            continue
-        if choice == "2":
-            _handle_pull(adb_path, device.serial)
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def _show_logging_menu(adb_path: str, device: Device) -> None:
+    serial = device.serial
+    handlers: Dict[str, Callable[[], None]] = {
+        "tail_logcat": lambda: _handle_tail_logcat(adb_path, serial),
+        "logcat_snapshot": lambda: save_logcat_snapshot(adb_path, serial),
+        "tail_filtered_logcat": lambda: tail_filtered_logcat(adb_path, serial),
+        "bugreport_bundle": lambda: _handle_bugreport_bundle(adb_path, serial),
+        "health_report": lambda: export_health_report(adb_path, serial),
+    }
     while True:
         print("\nLogging and diagnostics")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(LOGGING_MENU_LINES)
-        choice = input("> ").strip()
+        print(LOGGING_MENU_TEXT)
+        action = LOGGING_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return
-        if choice == "1":
-            try:
-                run_streaming(adb_cmd(adb_path, device.serial, "logcat"))
-            except KeyboardInterrupt:
-                print()
-            continue
-        if choice == "2":
-            save_logcat_snapshot(adb_path, device.serial)
-            continue
-        if choice == "3":
-            tail_filtered_logcat(adb_path, device.serial)
-            continue
-        if choice == "4":
-            if not confirm("Collect diagnostics bundle now? This may take a while."):
-                continue
-            collect_bugreport_bundle(adb_path, device.serial)
-            continue
-        if choice == "5":
-            export_health_report(adb_path, device.serial)
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def _show_workflow_manager(adb_path: str, serial: str) -> None:
@@ -367,132 +379,86 @@ def _show_profile_manager(settings: Settings) -> None:
 
 
 def _show_utilities_menu(adb_path: str, device: Device, shell_history: List[str], settings: Settings) -> None:
+    serial = device.serial
+    handlers: Dict[str, Callable[[], None]] = {
+        "shell": lambda: _handle_shell_command(adb_path, serial, shell_history),
+        "workflows": lambda: _show_workflow_manager(adb_path, serial),
+        "profiles": lambda: _show_profile_manager(settings),
+        "dev_loop": lambda: run_dev_loop(adb_path, serial, active_profile=settings.active_profile),
+        "plugins": lambda: run_plugins(adb_path, serial),
+        "broadcast": lambda: multi_device_broadcast(adb_path),
+        "package_search": lambda: interactive_package_search(adb_path, serial),
+        "scheduled_logs": lambda: scheduled_log_capture(adb_path, serial),
+    }
     while True:
         print("\nUtilities")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(UTILITIES_MENU_LINES)
-        choice = input("> ").strip()
+        print(UTILITIES_MENU_TEXT)
+        action = UTILITIES_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return
-        if choice == "1":
-            _handle_shell_command(adb_path, device.serial, shell_history)
-            continue
-        if choice == "2":
-            _show_workflow_manager(adb_path, device.serial)
-            continue
-        if choice == "3":
-            _show_profile_manager(settings)
-            continue
-        if choice == "4":
-            run_dev_loop(adb_path, device.serial, active_profile=settings.active_profile)
-            continue
-        if choice == "5":
-            run_plugins(adb_path, device.serial)
-            continue
-        if choice == "6":
-            multi_device_broadcast(adb_path)
-            continue
-        if choice == "7":
-            interactive_package_search(adb_path, device.serial)
-            continue
-        if choice == "8":
-            scheduled_log_capture(adb_path, device.serial)
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def _show_advanced_menu(adb_path: str, device: Device) -> None:
+    serial = device.serial
+    handlers: Dict[str, Callable[[], None]] = {
+        "port_forwarding": lambda: manage_port_forwarding(adb_path, serial),
+        "screen_capture": lambda: screen_capture_tools(adb_path, serial),
+        "wireless_pairing": lambda: wireless_pairing(adb_path),
+        "snapshot_restore": lambda: _handle_snapshot_restore(adb_path, serial),
+        "permissions": lambda: app_permission_manager(adb_path, serial),
+        "intents": lambda: intent_deeplink_runner(adb_path, serial),
+        "process_inspector": lambda: process_service_inspector(adb_path, serial),
+        "network_diagnostics": lambda: network_diagnostics_pack(adb_path, serial),
+        "device_aliases": lambda: manage_device_aliases(adb_path),
+        "health_check": lambda: prerequisite_health_check(adb_path),
+    }
     while True:
         print("\nAdvanced")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(ADVANCED_MENU_LINES)
-        choice = input("> ").strip()
+        print(ADVANCED_MENU_TEXT)
+        action = ADVANCED_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return
-        if choice == "1":
-            manage_port_forwarding(adb_path, device.serial)
-            continue
-        if choice == "2":
-            screen_capture_tools(adb_path, device.serial)
-            continue
-        if choice == "3":
-            wireless_pairing(adb_path)
-            continue
-        if choice == "4":
-            print("1) Create snapshot")
-            print("2) Restore snapshot")
-            action = input("> ").strip()
-            if action == "1":
-                snapshot_device_state(adb_path, device.serial)
-            elif action == "2":
-                restore_device_state(adb_path, device.serial)
-            else:
-                print("Unknown option.")
-            continue
-        if choice == "5":
-            app_permission_manager(adb_path, device.serial)
-            continue
-        if choice == "6":
-            intent_deeplink_runner(adb_path, device.serial)
-            continue
-        if choice == "7":
-            process_service_inspector(adb_path, device.serial)
-            continue
-        if choice == "8":
-            network_diagnostics_pack(adb_path, device.serial)
-            continue
-        if choice == "9":
-            manage_device_aliases(adb_path)
-            continue
-        if choice == "10":
-            prerequisite_health_check(adb_path)
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def show_basic_menu(adb_path: str, device: Device, settings: Settings) -> Device:
     shell_history: List[str] = []
+    handlers: Dict[str, Callable[[], None]] = {
+        "app_package": lambda: _show_app_package_menu(adb_path, device, settings),
+        "file_transfer": lambda: _show_file_transfer_menu(adb_path, device),
+        "logging": lambda: _show_logging_menu(adb_path, device),
+        "utilities": lambda: _show_utilities_menu(adb_path, device, shell_history, settings),
+        "advanced": lambda: _show_advanced_menu(adb_path, device),
+    }
 
     while True:
         print("\nADB CLI Py")
         print(f"Device: {device.serial} [{device.state}]")
-        _print_menu(ADB_MENU_LINES)
-        choice = input("> ").strip()
+        print(ADB_MENU_TEXT)
+        action = ADB_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "exit":
             return device
-        if choice == "1":
+        if action == "device_session":
             device = _show_device_session_menu(adb_path, device, settings)
             continue
-        if choice == "2":
-            _show_app_package_menu(adb_path, device, settings)
-            continue
-        if choice == "3":
-            _show_file_transfer_menu(adb_path, device)
-            continue
-        if choice == "4":
-            _show_logging_menu(adb_path, device)
-            continue
-        if choice == "5":
-            _show_utilities_menu(adb_path, device, shell_history, settings)
-            continue
-        if choice == "6":
-            _show_advanced_menu(adb_path, device)
-            continue
-        print("Unknown option.")
+        _dispatch(handlers, action)
 
 
 def show_platform_tools_menu(prefer_project_local: bool) -> bool:
     while True:
         print("\nPlatform tools")
-        _print_menu(PLATFORM_TOOLS_MENU_LINES)
-        choice = input("> ").strip()
+        print(PLATFORM_TOOLS_MENU_TEXT)
+        action = PLATFORM_TOOLS_MENU_ACTIONS.get(input("> ").strip())
 
-        if choice == "0":
+        if action == "back":
             return False
-        if choice == "1":
+        if action == "reinstall":
             ensure_adb(force_install=True, prefer_project_local=prefer_project_local)
             print("Project-local platform-tools installation complete (./platform-tools, not system-wide).")
             return True
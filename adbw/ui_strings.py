@@ -1,4 +1,4 @@
-ADB_MENU_LINES = [
+ADB_MENU_LINES = (
     "1) Device and session",
     "2) App and package",
     "3) File transfer",
@@ -6,18 +6,37 @@ ADB_MENU_LINES = [
     "5) Utilities",
     "6) Advanced",
     "0) Exit",
-]
+)
+ADB_MENU_TEXT = "\n".join(ADB_MENU_LINES)
+ADB_MENU_ACTIONS = {
+    "1": "device_session",
+    "2": "app_package",
+    "3": "file_transfer",
+    "4": "logging",
+    "5": "utilities",
+    "6": "advanced",
+    "0": "exit",
+}
 
-DEVICE_SESSION_MENU_LINES = [
+DEVICE_SESSION_MENU_LINES = (
     "1) Show device summary",
     "2) Switch device",
     "3) Reboot device",
     "4) Connect over Wi-Fi (tcpip/connect)",
     "5) Disconnect Wi-Fi device",
     "0) Back",
-]
+)
+DEVICE_SESSION_MENU_TEXT = "\n".join(DEVICE_SESSION_MENU_LINES)
+DEVICE_SESSION_MENU_ACTIONS = {
+    "1": "summary",
+    "2": "switch_device",
+    "3": "reboot",
+    "4": "wifi_connect",
+    "5": "wifi_disconnect",
+    "0": "back",
+}
 
-APP_PACKAGE_MENU_LINES = [
+APP_PACKAGE_MENU_LINES = (
     "1) Install APK",
     "2) Install split APKs",
     "3) APK insight",
@@ -27,25 +46,55 @@ APP_PACKAGE_MENU_LINES = [
     "7) Uninstall package",
     "8) Force-stop app",
     "9) Clear app data",
+    "10) APK metadata only (no device checks)",
     "0) Back",
-]
+)
+APP_PACKAGE_MENU_TEXT = "\n".join(APP_PACKAGE_MENU_LINES)
+APP_PACKAGE_MENU_ACTIONS = {
+    "1": "install_apk",
+    "2": "install_split_apks",
+    "3": "apk_insight",
+    "4": "list_packages",
+    "5": "package_info",
+    "6": "launch_app",
+    "7": "uninstall",
+    "8": "force_stop",
+    "9": "clear_data",
+    "10": "apk_metadata",
+    "0": "back",
+}
 
-FILE_TRANSFER_MENU_LINES = [
+FILE_TRANSFER_MENU_LINES = (
     "1) Push file to device",
     "2) Pull file from device",
     "0) Back",
-]
+)
+FILE_TRANSFER_MENU_TEXT = "\n".join(FILE_TRANSFER_MENU_LINES)
+FILE_TRANSFER_MENU_ACTIONS = {
+    "1": "push",
+    "2": "pull",
+    "0": "back",
+}
 
-LOGGING_MENU_LINES = [
+LOGGING_MENU_LINES = (
     "1) Tail logcat (Ctrl+C to stop)",
     "2) Save logcat snapshot",
     "3) Tail filtered logcat",
     "4) Collect logcat + bugreport bundle",
     "5) Export health report (JSON + TXT)",
     "0) Back",
-]
+)
+LOGGING_MENU_TEXT = "\n".join(LOGGING_MENU_LINES)
+LOGGING_MENU_ACTIONS = {
+    "1": "tail_logcat",
+    "2": "logcat_snapshot",
+    "3": "tail_filtered_logcat",
+    "4": "bugreport_bundle",
+    "5": "health_report",
+    "0": "back",
+}
 
-UTILITIES_MENU_LINES = [
+UTILITIES_MENU_LINES = (
     "1) Run shell command (!history, !<index>)",
     "2) Workflow manager",
     "3) Profile manager",
@@ -55,9 +104,21 @@ UTILITIES_MENU_LINES = [
     "7) Interactive package search",
     "8) Scheduled log capture",
     "0) Back",
-]
+)
+UTILITIES_MENU_TEXT = "\n".join(UTILITIES_MENU_LINES)
+UTILITIES_MENU_ACTIONS = {
+    "1": "shell",
+    "2": "workflows",
+    "3": "profiles",
+    "4": "dev_loop",
+    "5": "plugins",
+    "6": "broadcast",
+    "7": "package_search",
+    "8": "scheduled_logs",
+    "0": "back",
+}
 
-ADVANCED_MENU_LINES = [
+ADVANCED_MENU_LINES = (
     "1) Port forward/reverse manager",
     "2) Screen capture tools",
     "3) Wireless pairing (adb pair)",
@@ -69,9 +130,28 @@ ADVANCED_MENU_LINES = [
     "9) Device aliases",
     "10) Prerequisite health check",
     "0) Back",
-]
+)
+ADVANCED_MENU_TEXT = "\n".join(ADVANCED_MENU_LINES)
+ADVANCED_MENU_ACTIONS = {
+    "1": "port_forwarding",
+    "2": "screen_capture",
+    "3": "wireless_pairing",
+    "4": "snapshot_restore",
+    "5": "permissions",
+    "6": "intents",
+    "7": "process_inspector",
+    "8": "network_diagnostics",
+    "9": "device_aliases",
+    "10": "health_check",
+    "0": "back",
+}
 
-PLATFORM_TOOLS_MENU_LINES = [
+PLATFORM_TOOLS_MENU_LINES = (
     "1) Re-download and reinstall project-local platform-tools (./platform-tools, not system-wide)",
     "0) Back",
-]
+)
+PLATFORM_TOOLS_MENU_TEXT = "\n".join(PLATFORM_TOOLS_MENU_LINES)
+PLATFORM_TOOLS_MENU_ACTIONS = {
+    "1": "reinstall",
+    "0": "back",
+}
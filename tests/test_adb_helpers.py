@@ -1,9 +1,12 @@
 import os
+import sys
 import tempfile
+import time
 import unittest
+from unittest import mock
 
-from adbw import config
-from adbw.adb import command_failure_suggestion, is_transient_adb_failure
+from adbw import adb, config
+from adbw.adb import command_failure_suggestion, is_transient_adb_failure, redact_sensitive_text, run_output_chunks
 from adbw.config import Settings, load_settings, save_settings
 
 
@@ -18,6 +21,38 @@ class TestAdbHelpers(unittest.TestCase):
         self.assertIn("connect a device", command_failure_suggestion("", "no devices/emulators found"))
         self.assertIn("verify the source/destination path", command_failure_suggestion("", "failed to stat"))
 
+    def test_redact_sensitive_text(self) -> None:
+        text = "user=dev@example.com password=hunter2 gateway 10.0.0.1"
+        actual = redact_sensitive_text(text)
+        self.assertEqual(actual, "user=[REDACTED_EMAIL] [REDACTED_SECRET] gateway [REDACTED_IP]")
+
+
+class TestRunOutputChunks(unittest.TestCase):
+    def test_dry_run_yields_nothing(self) -> None:
+        with mock.patch.object(adb, "RUNTIME_DRY_RUN", True), mock.patch("builtins.print"):
+            chunks = list(run_output_chunks([sys.executable, "-c", "print('never')"]))
+        self.assertEqual(chunks, [])
+
+    def test_output_and_stderr_are_recorded(self) -> None:
+        script = "import sys; print('one'); print('two'); sys.stderr.write('device offline')"
+        with mock.patch.object(adb, "append_transcript") as transcript:
+            chunks = list(run_output_chunks([sys.executable, "-c", script]))
+        self.assertEqual("".join(chunks).splitlines(), ["one", "two"])
+        entry = transcript.call_args[0][0]
+        self.assertIn("rc=0", entry)
+        self.assertIn("device offline", entry)
+
+    def test_timeout_kills_hung_command_while_reading(self) -> None:
+        script = "import sys, time; print('first'); sys.stdout.flush(); time.sleep(10)"
+        started = time.monotonic()
+        with mock.patch.object(adb, "RUNTIME_COMMAND_TIMEOUT_SEC", 1), mock.patch.object(
+            adb, "append_transcript"
+        ) as transcript, mock.patch("builtins.print"):
+            chunks = list(run_output_chunks([sys.executable, "-c", script]))
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual("".join(chunks), "first\n")
+        self.assertIn("rc=124", transcript.call_args[0][0])
+
 
 class TestSettingsRoundTrip(unittest.TestCase):
     def test_save_and_load_settings(self) -> None:
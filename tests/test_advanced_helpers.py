@@ -0,0 +1,137 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from adbw import adb
+from adbw import advanced
+from adbw.advanced import (
+    _aapt_badging,
+    _parse_aapt_badging,
+    _parse_getprop,
+    _parse_settings_map,
+    _read_json,
+    _redact_values,
+    _settings_put_scripts,
+    _write_json,
+)
+
+
+AAPT_BADGING = """package: name='com.example.app' versionCode='42' versionName='1.4.2' platformBuildVersionName='14'
+sdkVersion:'24'
+targetSdkVersion:'34'
+application-label:'Example'
+"""
+
+
+class TestAaptParsing(unittest.TestCase):
+    def test_parse_aapt_badging(self) -> None:
+        actual = _parse_aapt_badging(AAPT_BADGING)
+        self.assertEqual(actual, ("com.example.app", "42", "1.4.2", "24", "34"))
+
+    def test_parse_aapt_badging_reordered_package_fields(self) -> None:
+        out = "package: versionName='2.0' compileSdkVersionCodename='14' name='com.example.other' versionCode='7'\n"
+        actual = _parse_aapt_badging(out)
+        self.assertEqual(actual, ("com.example.other", "7", "2.0", "", ""))
+
+    def test_parse_aapt_badging_missing_fields(self) -> None:
+        self.assertEqual(_parse_aapt_badging("application-label:'Example'\n"), ("", "", "", "", ""))
+
+
+class TestAaptBadgingCache(unittest.TestCase):
+    def test_only_successful_output_is_cached(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            apk = os.path.join(tmpdir, "app.apk")
+            with open(apk, "wb") as f:
+                f.write(b"apk")
+            empty = subprocess.CompletedProcess([], 0, "", "")
+            ok = subprocess.CompletedProcess([], 0, AAPT_BADGING, "")
+            with mock.patch.object(advanced, "_aapt_badging_cache", {}), mock.patch.object(
+                advanced, "run", side_effect=[empty, ok]
+            ) as fake_run:
+                self.assertEqual(_aapt_badging(apk), "")
+                self.assertEqual(_aapt_badging(apk), AAPT_BADGING)
+                self.assertEqual(_aapt_badging(apk), AAPT_BADGING)
+
+        self.assertEqual(fake_run.call_count, 2)
+
+
+class TestGetpropParsing(unittest.TestCase):
+    def test_parse_getprop_dump(self) -> None:
+        raw = "[ro.product.model]: [Pixel 7]\n[ro.build.version.sdk]: [34]\n[net.dns1]: []\nnot a prop line\n"
+        props = _parse_getprop(raw)
+        self.assertEqual(props["ro.product.model"], "Pixel 7")
+        self.assertEqual(props["ro.build.version.sdk"], "34")
+        self.assertEqual(props["net.dns1"], "")
+        self.assertEqual(len(props), 3)
+
+
+class TestSettingsMapParsing(unittest.TestCase):
+    def test_parse_settings_map(self) -> None:
+        raw = "adb_enabled=1\nwifi_on = 1 \nsetting_with_eq=a=b\nno separator here\n"
+        actual = _parse_settings_map(raw)
+        self.assertEqual(actual, {"adb_enabled": "1", "wifi_on": "1", "setting_with_eq": "a=b"})
+
+    def test_settings_put_scripts_batch_and_quote(self) -> None:
+        scripts = _settings_put_scripts("global", {"a": "1", "b": "two words", "c": "3"}, batch_size=2)
+        self.assertEqual(
+            scripts,
+            [
+                "rc=0; settings put global a 1 || rc=1; settings put global b 'two words' || rc=1; exit $rc",
+                "rc=0; settings put global c 3 || rc=1; exit $rc",
+            ],
+        )
+
+    def test_settings_put_scripts_cap_encoded_length(self) -> None:
+        settings_map = {f"key{i}": "\u00e9" * 100 for i in range(20)}
+        scripts = _settings_put_scripts("secure", settings_map, batch_size=50, max_bytes=1000)
+        self.assertGreater(len(scripts), 1)
+        for script in scripts:
+            self.assertLessEqual(len(script.encode("utf-8")), 1000)
+        self.assertEqual(sum(script.count("settings put ") for script in scripts), 20)
+
+
+class TestRedactValues(unittest.TestCase):
+    def test_redacts_nested_string_values_only(self) -> None:
+        old_redact = adb.RUNTIME_REDACT_EXPORTS
+        try:
+            adb.RUNTIME_REDACT_EXPORTS = True
+            data = {"ip_route": "default via 192.168.1.1", "nested": ["mail me@example.com"], "count": 3}
+            actual = _redact_values(data)
+        finally:
+            adb.RUNTIME_REDACT_EXPORTS = old_redact
+
+        self.assertIs(actual, data)
+        self.assertEqual(data["ip_route"], "default via [REDACTED_IP]")
+        self.assertEqual(data["nested"], ["mail [REDACTED_EMAIL]"])
+        self.assertEqual(data["count"], 3)
+
+
+class TestJsonFiles(unittest.TestCase):
+    def test_write_then_read_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "aliases.json")
+            _write_json(path, {"phone": "ABC123"})
+            _write_json(path, {"phone": "DEF456"})
+            actual = _read_json(path, {})
+
+        self.assertEqual(actual, {"phone": "DEF456"})
+
+    def test_missing_file_returns_default(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.assertEqual(_read_json(os.path.join(tmpdir, "missing.json"), []), [])
+
+    def test_failed_write_removes_tmp_and_keeps_original(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "aliases.json")
+            _write_json(path, {"phone": "ABC123"})
+            with mock.patch.object(advanced, "_dumps", side_effect=TypeError("not serializable")):
+                with self.assertRaises(TypeError):
+                    _write_json(path, {"phone": object()})
+            self.assertFalse(os.path.exists(f"{path}.tmp"))
+            self.assertEqual(_read_json(path, {}), {"phone": "ABC123"})
+
+
+if __name__ == "__main__":
+    unittest.main()